@@ -1,27 +1,30 @@
 """Data acquisition tools for Wagnerds."""
 
+import importlib
 from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING
 
-from .base_source import DataSource, RemoteDataError
-from .chembl import ChemblData
-from .chemidplus import ChemIDplusData
-from .custom import CustomData
-from .do import DoData
-from .drugbank import DrugBankData
-from .drugsatfda import DrugsAtFdaData
-from .ensembl import EnsemblData
-from .ensembl_transcript_mappings import EnsemblTranscriptMappingData
-from .guide_to_pharmacology import GToPLigandData
-from .hemonc import HemOncData
-from .hgnc import HgncData
-from .moa import MoaData
-from .mondo import MondoData
-from .ncbi import NcbiGeneData, NcbiGenomeData
-from .ncbi_lrg_refseqgene import NcbiLrgRefSeqGeneData
-from .ncbi_mane_summary import NcbiManeSummaryData
-from .ncit import NcitData
-from .oncotree import OncoTreeData
-from .rxnorm import RxNormData
+if TYPE_CHECKING:
+    from .base_source import DataSource, RemoteDataError
+    from .chembl import ChemblData
+    from .chemidplus import ChemIDplusData
+    from .custom import CustomData
+    from .do import DoData
+    from .drugbank import DrugBankData
+    from .drugsatfda import DrugsAtFdaData
+    from .ensembl import EnsemblData
+    from .ensembl_transcript_mappings import EnsemblTranscriptMappingData
+    from .guide_to_pharmacology import GToPLigandData
+    from .hemonc import HemOncData
+    from .hgnc import HgncData
+    from .moa import MoaData
+    from .mondo import MondoData
+    from .ncbi import NcbiGeneData, NcbiGenomeData
+    from .ncbi_lrg_refseqgene import NcbiLrgRefSeqGeneData
+    from .ncbi_mane_summary import NcbiManeSummaryData
+    from .ncit import NcitData
+    from .oncotree import OncoTreeData
+    from .rxnorm import RxNormData
 
 try:
     __version__ = version("wags-tails")
@@ -30,6 +33,59 @@ except PackageNotFoundError:
 finally:
     del version, PackageNotFoundError
 
+# Exported classes, and the modules that define them. Modules are only imported upon
+# first access to one of their classes, so that e.g. the CLI doesn't need to load
+# every source (and its dependencies) just to start up.
+_LAZY_IMPORTS = {
+    "DataSource": ".base_source",
+    "RemoteDataError": ".base_source",
+    "ChemblData": ".chembl",
+    "ChemIDplusData": ".chemidplus",
+    "CustomData": ".custom",
+    "DoData": ".do",
+    "DrugBankData": ".drugbank",
+    "DrugsAtFdaData": ".drugsatfda",
+    "EnsemblData": ".ensembl",
+    "EnsemblTranscriptMappingData": ".ensembl_transcript_mappings",
+    "GToPLigandData": ".guide_to_pharmacology",
+    "HemOncData": ".hemonc",
+    "HgncData": ".hgnc",
+    "MoaData": ".moa",
+    "MondoData": ".mondo",
+    "NcbiGeneData": ".ncbi",
+    "NcbiGenomeData": ".ncbi",
+    "NcbiManeSummaryData": ".ncbi_mane_summary",
+    "NcbiLrgRefSeqGeneData": ".ncbi_lrg_refseqgene",
+    "NcitData": ".ncit",
+    "OncoTreeData": ".oncotree",
+    "RxNormData": ".rxnorm",
+}
+
+
+def __getattr__(name: str) -> type:
+    """Import exported classes upon first access.
+
+    :param name: name of attribute to get
+    :return: requested class
+    :raise AttributeError: if no such attribute exists
+    """
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        obj = getattr(module, name)
+        globals()[name] = obj
+        return obj
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+def __dir__() -> list[str]:
+    """Include lazily-imported classes in module attribute listing.
+
+    :return: names of module attributes
+    """
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
 __all__ = [
     "DataSource",
     "RemoteDataError",
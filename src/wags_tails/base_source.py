@@ -8,11 +8,10 @@ import abc
 import datetime
 import logging
 from collections.abc import Generator
+from functools import cached_property
 from pathlib import Path
 
-import requests
-
-from wags_tails.utils.downloads import HTTPS_REQUEST_TIMEOUT
+from wags_tails.utils.downloads import HTTP_SESSION, HTTPS_REQUEST_TIMEOUT, load_json
 
 from .utils.storage import get_data_dir, get_latest_local_file
 from .utils.versioning import DATE_VERSION_PATTERN, parse_file_version
@@ -42,13 +41,30 @@ class DataSource(abc.ABC):
             details.
         :param silent: if True, don't print any info/updates to console
         """
-        if not data_dir:
-            data_dir = get_data_dir() / self._src_name
+        self._data_dir = data_dir
+        self._silent = silent
+
+    @cached_property
+    def data_dir(self) -> Path:
+        """Location of data files for this source.
+
+        Resolved, and created if necessary, upon first access, so that instantiating
+        a source doesn't touch the filesystem until its data is actually needed.
+
+        :return: path to data directory
+        """
+        data_dir = self._data_dir if self._data_dir else get_data_dir() / self._src_name
         data_dir.mkdir(exist_ok=True)
-        self.data_dir = data_dir
+        return data_dir
+
+    @cached_property
+    def _tqdm_params(self) -> dict:
+        """Get TQDM configuration for download progress bars.
 
-        self._tqdm_params = {
-            "disable": silent,
+        :return: keyword arguments for ``tqdm``
+        """
+        return {
+            "disable": self._silent,
             "unit": "B",
             "ncols": 80,
             "unit_divisor": 1024,
@@ -149,9 +165,9 @@ class GitHubDataSource(DataSource):
         :return: Generator yielding version strings
         """
         url = f"https://api.github.com/repos/{self._repo}/releases"
-        response = requests.get(url, timeout=HTTPS_REQUEST_TIMEOUT)
+        response = HTTP_SESSION.get(url, timeout=HTTPS_REQUEST_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
+        data = load_json(response.content)
         for release in data:
             yield (
                 datetime.datetime.strptime(release["tag_name"], "v%Y-%m-%d")
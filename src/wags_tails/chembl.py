@@ -5,10 +5,10 @@ import re
 import tarfile
 from pathlib import Path
 
-import requests
-
 from .base_source import DataSource, RemoteDataError
-from .utils.downloads import HTTPS_REQUEST_TIMEOUT, download_http
+from .utils.downloads import HTTP_SESSION, HTTPS_REQUEST_TIMEOUT, download_http
+
+_RELEASE_VERSION_PATTERN = re.compile(r"^\*\s*Release:\s*chembl_(\d*)", re.MULTILINE)
 
 
 class ChemblData(DataSource):
@@ -27,17 +27,13 @@ class ChemblData(DataSource):
         latest_readme_url = (
             "https://ftp.ebi.ac.uk/pub/databases/chembl/ChEMBLdb/latest/README"
         )
-        response = requests.get(latest_readme_url, timeout=HTTPS_REQUEST_TIMEOUT)
+        response = HTTP_SESSION.get(latest_readme_url, timeout=HTTPS_REQUEST_TIMEOUT)
         response.raise_for_status()
-        data = response.text
-        pattern = re.compile(r"\*\s*Release:\s*chembl_(\d*).*")
-        for line in data.splitlines():
-            m = re.match(pattern, line)
-            if m and m.group():
-                return m.group(1)
-        else:
-            msg = "Unable to parse latest ChEMBL version number from latest release README"
-            raise RemoteDataError(msg)
+        m = _RELEASE_VERSION_PATTERN.search(response.text)
+        if m:
+            return m.group(1)
+        msg = "Unable to parse latest ChEMBL version number from latest release README"
+        raise RemoteDataError(msg)
 
     @staticmethod
     def _tarball_handler(dl_path: Path, outfile_path: Path) -> None:
@@ -4,12 +4,12 @@ import datetime
 import re
 from pathlib import Path
 
-import requests
-
 from .base_source import DataSource, RemoteDataError
-from .utils.downloads import HTTPS_REQUEST_TIMEOUT, download_http
+from .utils.downloads import HTTP_SESSION, HTTPS_REQUEST_TIMEOUT, download_http
 from .utils.versioning import DATE_VERSION_PATTERN
 
+_RELEASE_DATE_PATTERN = re.compile(r" date=\"([0-9]{4}-[0-9]{2}-[0-9]{2})\">")
+
 
 class ChemIDplusData(DataSource):
     """Provide access to ChemIDplus database."""
@@ -26,9 +26,9 @@ class ChemIDplusData(DataSource):
         """
         latest_url = "https://ftp.nlm.nih.gov/projects/chemidlease/CurrentChemID.xml"
         headers = {"Range": "bytes=0-300"}  # leave some slack to capture date
-        r = requests.get(latest_url, headers=headers, timeout=HTTPS_REQUEST_TIMEOUT)
+        r = HTTP_SESSION.get(latest_url, headers=headers, timeout=HTTPS_REQUEST_TIMEOUT)
         r.raise_for_status()
-        result = re.search(r" date=\"([0-9]{4}-[0-9]{2}-[0-9]{2})\">", r.text)
+        result = _RELEASE_DATE_PATTERN.search(r.text)
         if not result:
             msg = "Unable to parse latest ChemIDplus version number from partial access to latest file"
             raise RemoteDataError(msg)
@@ -1,13 +1,19 @@
 """Provide a CLI application for accessing basic wags-tails functions."""
 
-import inspect
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING
 
 import click
 
 import wags_tails
 from wags_tails.utils.storage import get_data_dir
 
+if TYPE_CHECKING:
+    from wags_tails.base_source import DataSource
+
+_logger = logging.getLogger(__name__)
+
 
 def _configure_logs(log_level: int = logging.INFO) -> None:
     """Configure logging.
@@ -34,15 +40,46 @@ def path() -> None:
     click.echo(get_data_dir())
 
 
+# Maximum number of sources to fetch simultaneously
+_MAX_WORKERS = 8
+
+# Map source names to the names of their data classes. Classes are looked up only
+# once a command needs them, rather than by reflecting over the package up front.
 _DATA_SOURCES = {
-    obj._src_name: obj  # noqa: SLF001
-    for _, obj in inspect.getmembers(wags_tails, inspect.isclass)
-    if obj.__name__ not in {"CustomData", "DataSource", "RemoteDataError"}
+    "chemidplus": "ChemIDplusData",
+    "chembl": "ChemblData",
+    "do": "DoData",
+    "drugbank": "DrugBankData",
+    "drugsatfda": "DrugsAtFdaData",
+    "ensembl": "EnsemblData",
+    "ensembl_transcript_mappings": "EnsemblTranscriptMappingData",
+    "guidetopharmacology": "GToPLigandData",
+    "hemonc": "HemOncData",
+    "hgnc": "HgncData",
+    "moalmanac": "MoaData",
+    "mondo": "MondoData",
+    "ncbi": "NcbiGenomeData",
+    "ncbi_lrg_refseqgene": "NcbiLrgRefSeqGeneData",
+    "ncbi_mane_summary": "NcbiManeSummaryData",
+    "ncit": "NcitData",
+    "oncotree": "OncoTreeData",
+    "rxnorm": "RxNormData",
 }
 
 
+def _get_data_class(source: str) -> type["DataSource"]:
+    """Get data class for a source.
+
+    :param source: source name, as given in ``_DATA_SOURCES``
+    :return: corresponding data class
+    """
+    return getattr(wags_tails, _DATA_SOURCES[source])
+
+
 @cli.command
-@click.argument("data", nargs=1, type=click.Choice(list(_DATA_SOURCES.keys())))
+@click.argument(
+    "data", nargs=-1, required=True, type=click.Choice(list(_DATA_SOURCES.keys()))
+)
 @click.option(
     "--silent",
     "-s",
@@ -62,13 +99,22 @@ _DATA_SOURCES = {
     default=False,
     help="Retrieve data from source regardless of local availability.",
 )
-def get_latest(data: str, silent: bool, from_local: bool, force_refresh: bool) -> None:
+def get_latest(
+    data: tuple[str, ...], silent: bool, from_local: bool, force_refresh: bool
+) -> None:
     """Get latest version of specified data.
 
     For example, to retrieve the latest Disease Ontology release:
 
         % wags-tails get-version do
 
+    Multiple sources may be given, in which case they're fetched concurrently, and
+    a failure to acquire one source doesn't prevent acquisition of the others.
+    Download progress isn't shown for concurrent fetches, as it can't be displayed
+    legibly, so only the resulting file paths are printed:
+
+        % wags-tails get-latest do mondo ncit
+
     Unless --from_local is declared, wags-tails will first make an API call
     against the resource to determine the most recent release version, and then either
     provide a local copy if already available, or first download from the data origin
@@ -77,9 +123,37 @@ def get_latest(data: str, silent: bool, from_local: bool, force_refresh: bool) -
     The --help option for this command will display all legal inputs for DATA; alternatively,
     use the list-sources command to show them in a computable (line-delimited) format.
     """
-    data_class = _DATA_SOURCES[data]
-    result, _ = data_class(silent=silent).get_latest(from_local, force_refresh)
-    click.echo(result)
+    if len(data) == 1:
+        data_class = _get_data_class(data[0])
+        result, _ = data_class(silent=silent).get_latest(from_local, force_refresh)
+        click.echo(result)
+        return
+
+    sources = list(dict.fromkeys(data))
+    # progress output from concurrent downloads would be interleaved, so suppress it
+    failed = False
+    with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(sources))) as executor:
+        futures = {
+            executor.submit(
+                _get_data_class(source)(silent=True).get_latest,
+                from_local,
+                force_refresh,
+            ): source
+            for source in sources
+        }
+        for future in as_completed(futures):
+            try:
+                result, _ = future.result()
+            except Exception as e:
+                _logger.exception("Unable to get latest %s data", futures[future])
+                click.echo(
+                    f"Unable to get latest {futures[future]} data: {e}", err=True
+                )
+                failed = True
+            else:
+                click.echo(result)
+    if failed:
+        raise click.exceptions.Exit(1)
 
 
 @cli.command
@@ -4,10 +4,13 @@ import datetime
 import tarfile
 from pathlib import Path
 
-import requests
-
 from .base_source import GitHubDataSource
-from .utils.downloads import HTTPS_REQUEST_TIMEOUT, download_http
+from .utils.downloads import (
+    HTTP_SESSION,
+    HTTPS_REQUEST_TIMEOUT,
+    download_http,
+    load_json,
+)
 from .utils.versioning import DATE_VERSION_PATTERN
 
 
@@ -44,9 +47,9 @@ class DoData(GitHubDataSource):
             .strftime("v%Y-%m-%d")
         )
         tag_info_url = f"https://api.github.com/repos/{self._repo}/releases/tags/{formatted_version}"
-        response = requests.get(tag_info_url, timeout=HTTPS_REQUEST_TIMEOUT)
+        response = HTTP_SESSION.get(tag_info_url, timeout=HTTPS_REQUEST_TIMEOUT)
         response.raise_for_status()
-        tarball_url = response.json()["tarball_url"]
+        tarball_url = load_json(response.content)["tarball_url"]
         download_http(
             tarball_url,
             outfile,
@@ -1,17 +1,28 @@
 """Provide source fetching for DrugBank."""
 
 import logging
+import os
 import re
 from pathlib import Path
 
 import requests
 
 from .base_source import DataSource, RemoteDataError
-from .utils.downloads import HTTPS_REQUEST_TIMEOUT, download_http, handle_zip
-from .utils.versioning import parse_file_version
+from .utils.downloads import download_http, handle_zip, load_json
+from .utils.local_index import get_latest_local, update_local_index
+from .utils.versioning import (
+    cache_version,
+    fetch_latest_version,
+    numeric_version_key,
+)
 
 _logger = logging.getLogger(__name__)
 
+_RELEASE_URL_PATTERN = re.compile(
+    r"https://go\.drugbank\.com/releases/(.*)/downloads/all-drugbank-vocabulary"
+)
+_FILE_VERSION_PATTERN = re.compile(r"drugbank_(\d+(?:\.\d+)*)\.csv")
+
 
 class DrugBankData(DataSource):
     """Provide access to DrugBank database."""
@@ -20,52 +31,74 @@ class DrugBankData(DataSource):
     _filetype = "csv"
 
     @staticmethod
-    def _get_latest_version() -> tuple[str, str]:
-        """Retrieve latest version value
+    def _parse_latest_version(r: requests.Response) -> tuple[str, str]:
+        """Parse latest version value from releases API response
 
+        :param r: response from releases API
         :return: latest release value and base download URL
         :raise RemoteDataError: if unable to parse version number from releases API
         """
-        releases_url = "https://go.drugbank.com/releases/latest.json"
-        r = requests.get(releases_url, timeout=HTTPS_REQUEST_TIMEOUT)
-        r.raise_for_status()
         try:
-            latest = r.json()[0]
+            latest = load_json(r.content)[0]
             url = latest["url"]
-            version = (
-                re.match(
-                    r"https:\/\/go.drugbank.com\/releases\/(.*)\/downloads\/all-drugbank-vocabulary",
-                    url,
-                )
-                .groups()[0]
-                .replace("-", ".")
-            )
+            version = _RELEASE_URL_PATTERN.match(url).groups()[0].replace("-", ".")
             return version, url
         except (KeyError, IndexError) as e:
             msg = "Unable to parse latest DrugBank version number from releases API endpoint"
             raise RemoteDataError(msg) from e
 
-    def _get_latest_local_file(self, glob: str) -> tuple[Path, str]:
+    @cache_version()
+    def _get_latest_version(self) -> tuple[str, str]:
+        """Retrieve latest version value
+
+        :return: latest release value and base download URL
+        :raise RemoteDataError: if unable to parse version number from releases API
+        """
+        version, url = fetch_latest_version(
+            "https://go.drugbank.com/releases/latest.json",
+            self.data_dir,
+            self._parse_latest_version,
+        )
+        return version, url
+
+    def _get_latest_local_file(self) -> tuple[Path, str]:
         """Get most recent locally-available file. DrugBank uses versioning that isn't
         easily sortable by default so we have to use some extra magic.
 
-        :param glob: file pattern to match against
+        Checks the local file index first, and only scans the data directory if the
+        index is unavailable or out of date.
+
         :return: Path to most recent file, and its version
         :raise FileNotFoundError: if no local data is available
         """
-        _logger.debug("Getting local match against pattern %s...", glob)
-        file_version_pairs = []
-        for file in self.data_dir.glob(glob):
-            version = parse_file_version(file, r"drugbank_([\d\.]+).csv")
-            formatted_version = [int(digits) for digits in version.split(".")]
-            file_version_pairs.append((file, version, formatted_version))
-        files = sorted(file_version_pairs, key=lambda p: p[2])
-        if not files:
+        indexed = get_latest_local(self.data_dir, self._src_name)
+        if indexed:
+            _logger.debug(
+                "Returning %s as most recent locally-available file.", indexed[0]
+            )
+            return indexed
+        _logger.debug("Scanning %s for local DrugBank data...", self.data_dir)
+        with os.scandir(self.data_dir) as entries:
+            matches = (
+                _FILE_VERSION_PATTERN.match(entry.name)
+                for entry in entries
+                if entry.name.startswith("drugbank_") and entry.name.endswith(".csv")
+            )
+            latest = max(
+                (match for match in matches if match),
+                key=lambda m: numeric_version_key(m.group(1)),
+                default=None,
+            )
+        if latest is None:
             msg = "No source data found for DrugBank"
             raise FileNotFoundError(msg)
-        latest = files[-1]
-        _logger.debug("Returning %s as most recent locally-available file.", latest[0])
-        return latest[0], latest[1]
+        latest_file = self.data_dir / latest.string
+        latest_version = latest.group(1)
+        _logger.debug(
+            "Returning %s as most recent locally-available file.", latest_file
+        )
+        update_local_index(self.data_dir, self._src_name, latest_file, latest_version)
+        return latest_file, latest_version
 
     def _download_data(self, url: str, outfile: Path) -> None:
         """Download data file to specified location.
@@ -77,6 +110,7 @@ class DrugBankData(DataSource):
             url,
             outfile,
             handler=handle_zip,
+            in_memory=True,
             tqdm_params=self._tqdm_params,
         )
 
@@ -96,9 +130,11 @@ class DrugBankData(DataSource):
             raise ValueError(msg)
 
         if from_local:
-            file_path, version = self._get_latest_local_file("drugbank_*.csv")
+            file_path, version = self._get_latest_local_file()
             return file_path, version
 
+        if force_refresh:
+            self._get_latest_version.cache_clear()
         latest_version, latest_url = self._get_latest_version()
         latest_file = self.data_dir / f"drugbank_{latest_version}.csv"
         if (not force_refresh) and latest_file.exists():
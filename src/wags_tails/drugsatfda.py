@@ -3,10 +3,14 @@
 import datetime
 from pathlib import Path
 
-import requests
-
 from .base_source import DataSource, RemoteDataError
-from .utils.downloads import HTTPS_REQUEST_TIMEOUT, download_http, handle_zip
+from .utils.downloads import (
+    HTTP_SESSION,
+    HTTPS_REQUEST_TIMEOUT,
+    download_http,
+    handle_zip,
+    load_json,
+)
 from .utils.versioning import DATE_VERSION_PATTERN
 
 
@@ -23,11 +27,11 @@ class DrugsAtFdaData(DataSource):
         :return: latest release value
         :raise RemoteDataError: if unable to parse version number from releases API
         """
-        r = requests.get(
+        r = HTTP_SESSION.get(
             "https://api.fda.gov/download.json", timeout=HTTPS_REQUEST_TIMEOUT
         )
         r.raise_for_status()
-        r_json = r.json()
+        r_json = load_json(r.content)
         try:
             date = r_json["results"]["drug"]["drugsfda"]["export_date"]
         except KeyError as e:
@@ -2,10 +2,14 @@
 
 from pathlib import Path
 
-import requests
-
 from wags_tails.base_source import DataSource
-from wags_tails.utils.downloads import HTTPS_REQUEST_TIMEOUT, download_ftp, handle_gzip
+from wags_tails.utils.downloads import (
+    HTTP_SESSION,
+    HTTPS_REQUEST_TIMEOUT,
+    download_ftp,
+    handle_gzip,
+    load_json,
+)
 
 
 class EnsemblData(DataSource):
@@ -20,9 +24,9 @@ class EnsemblData(DataSource):
         :return: latest release value
         """
         url = "https://rest.ensembl.org/info/data/?content-type=application/json"
-        response = requests.get(url, timeout=HTTPS_REQUEST_TIMEOUT)
+        response = HTTP_SESSION.get(url, timeout=HTTPS_REQUEST_TIMEOUT)
         response.raise_for_status()
-        releases = response.json()["releases"]
+        releases = load_json(response.content)["releases"]
         releases.sort()
         latest_version = releases[-1]
         return f"GRCh38_{latest_version}"
@@ -1,19 +1,31 @@
 """Provide source fetching for Guide To Pharmacology."""
 
 import logging
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import NamedTuple
 
 import requests
 
 from .base_source import DataSource, RemoteDataError
-from .utils.downloads import HTTPS_REQUEST_TIMEOUT, download_http
-from .utils.storage import get_latest_local_file
-from .utils.versioning import parse_file_version
+from .utils.downloads import download_http
+from .utils.local_index import get_latest_local, update_local_index
+from .utils.versioning import (
+    cache_version,
+    fetch_latest_version,
+    numeric_version_key,
+)
 
 _logger = logging.getLogger(__name__)
 
+_RELEASE_VERSION_PATTERN = re.compile(r"Current Release Version (\d{4}\.\d) \(.*\)")
+_LIGANDS_FILE_PATTERN = re.compile(r"gtop_ligands_(\d{4}\.\d+)\.tsv")
+_LIGAND_ID_MAPPING_FILE_PATTERN = re.compile(
+    r"gtop_ligand_id_mapping_(\d{4}\.\d+)\.tsv"
+)
+
 
 class GtoPLigandPaths(NamedTuple):
     """Container for GuideToPharmacology file paths."""
@@ -29,42 +41,117 @@ class GToPLigandData(DataSource):
     _filetype = "tsv"
 
     @staticmethod
-    def _get_latest_version() -> str:
+    def _parse_latest_version(r: requests.Response) -> str:
+        """Parse latest version value from homepage response
+
+        :param r: response from homepage
+        :return: latest release value
+        :raise RemoteDataError: if unable to parse version number from homepage HTML
+        """
+        match = _RELEASE_VERSION_PATTERN.search(r.text)
+        if match:
+            return match.group(1)
+        msg = (
+            "Unable to parse latest Guide to Pharmacology version number homepage HTML."
+        )
+        raise RemoteDataError(msg)
+
+    @cache_version()
+    def _get_latest_version(self) -> str:
         """Retrieve latest version value
 
         :return: latest release value
-        :raise RemoteDataError: if unable to parse version number from releases API
+        :raise RemoteDataError: if unable to parse version number from homepage HTML
         """
-        r = requests.get(
-            "https://www.guidetopharmacology.org/", timeout=HTTPS_REQUEST_TIMEOUT
+        return fetch_latest_version(
+            "https://www.guidetopharmacology.org/",
+            self.data_dir,
+            self._parse_latest_version,
         )
-        r.raise_for_status()
-        r_text = r.text.split("\n")
-        pattern = re.compile(r"Current Release Version (\d{4}\.\d) \(.*\)")
-        for line in r_text:
-            if "Current Release Version" in line:
-                matches = re.findall(pattern, line.strip())
-                if matches:
-                    return matches[0]
-        else:
-            msg = "Unable to parse latest Guide to Pharmacology version number homepage HTML."
-            raise RemoteDataError(msg)
 
     def _download_data(self, file_paths: GtoPLigandPaths) -> None:
         """Perform file downloads.
 
+        Files are fetched concurrently, as download time is dominated by network
+        latency rather than by any local processing. Both requests go through the
+        shared HTTP session, so they draw on its pooled keep-alive connections to the
+        GtoP host (including the one opened by the version lookup).
+
         :param file_paths: locations to save files at
         """
-        download_http(
-            "https://www.guidetopharmacology.org/DATA/ligands.tsv",
-            file_paths.ligands,
-            tqdm_params=self._tqdm_params,
-        )
-        download_http(
-            "https://www.guidetopharmacology.org/DATA/ligand_id_mapping.tsv",
-            file_paths.ligand_id_mapping,
-            tqdm_params=self._tqdm_params,
+        downloads = [
+            (
+                "https://www.guidetopharmacology.org/DATA/ligands.tsv",
+                file_paths.ligands,
+            ),
+            (
+                "https://www.guidetopharmacology.org/DATA/ligand_id_mapping.tsv",
+                file_paths.ligand_id_mapping,
+            ),
+        ]
+        with ThreadPoolExecutor(max_workers=len(downloads)) as executor:
+            # give each concurrent download its own progress bar line
+            futures = [
+                executor.submit(
+                    download_http,
+                    url,
+                    outfile,
+                    tqdm_params={**self._tqdm_params, "position": i},
+                )
+                for i, (url, outfile) in enumerate(downloads)
+            ]
+            for future in futures:
+                future.result()
+
+    def _get_latest_local_files(self) -> tuple[GtoPLigandPaths, str]:
+        """Get most recent locally-available files.
+
+        Checks the local file index first, and only scans the data directory if the
+        index is unavailable or out of date.
+
+        :return: Paths to most recent files, and their version
+        :raise FileNotFoundError: if no local data is available
+        """
+        indexed = get_latest_local(self.data_dir, self._src_name)
+        if indexed:
+            ligands_path, version = indexed
+            ligand_id_mapping_path = (
+                self.data_dir / f"gtop_ligand_id_mapping_{version}.tsv"
+            )
+            if ligand_id_mapping_path.exists():
+                file_paths = GtoPLigandPaths(
+                    ligands=ligands_path, ligand_id_mapping=ligand_id_mapping_path
+                )
+                return file_paths, version
+
+        _logger.debug("Scanning %s for local GtoP data...", self.data_dir)
+        with os.scandir(self.data_dir) as entries:
+            file_names = [
+                entry.name
+                for entry in entries
+                if entry.name.startswith("gtop_") and entry.name.endswith(".tsv")
+            ]
+        latest_matches = []
+        for pattern in (_LIGANDS_FILE_PATTERN, _LIGAND_ID_MAPPING_FILE_PATTERN):
+            matches = (pattern.match(name) for name in file_names)
+            latest = max(
+                (match for match in matches if match),
+                key=lambda m: numeric_version_key(m.group(1)),
+                default=None,
+            )
+            if latest is None:
+                msg = f"Unable to find file in {self.data_dir.absolute()} matching pattern {pattern.pattern}"
+                raise FileNotFoundError(msg)
+            latest_matches.append(latest)
+        ligands_match, ligand_id_mapping_match = latest_matches
+        ligands_path = self.data_dir / ligands_match.string
+        file_paths = GtoPLigandPaths(
+            ligands=ligands_path,
+            ligand_id_mapping=self.data_dir / ligand_id_mapping_match.string,
         )
+        version = ligands_match.group(1)
+        update_local_index(self.data_dir, self._src_name, ligands_path, version)
+        return file_paths, version
 
     def get_latest(
         self, from_local: bool = False, force_refresh: bool = False
@@ -82,17 +169,10 @@ class GToPLigandData(DataSource):
             raise ValueError(msg)
 
         if from_local:
-            ligands_path = get_latest_local_file(self.data_dir, "gtop_ligands_*.tsv")
-            ligand_id_mapping_path = get_latest_local_file(
-                self.data_dir, "gtop_ligand_id_mapping_*.tsv"
-            )
-            file_paths = GtoPLigandPaths(
-                ligands=ligands_path, ligand_id_mapping=ligand_id_mapping_path
-            )
-            return file_paths, parse_file_version(
-                ligands_path, r"gtop_ligands_(\d{4}\.\d+).tsv"
-            )
+            return self._get_latest_local_files()
 
+        if force_refresh:
+            self._get_latest_version.cache_clear()
         latest_version = self._get_latest_version()
         ligands_path = self.data_dir / f"gtop_ligands_{latest_version}.tsv"
         ligand_id_mapping_path = (
@@ -7,15 +7,21 @@ import zipfile
 from pathlib import Path
 from typing import NamedTuple
 
-import requests
-
 from .base_source import DataSource, RemoteDataError
-from .utils.downloads import HTTPS_REQUEST_TIMEOUT, download_http
+from .utils.downloads import (
+    HTTP_SESSION,
+    HTTPS_REQUEST_TIMEOUT,
+    download_http,
+    load_json,
+)
 from .utils.storage import get_latest_local_file
 from .utils.versioning import parse_file_version
 
 _logger = logging.getLogger(__name__)
 
+_RELEASE_FILE_PATTERN = re.compile(r"(\d\d\d\d-\d\d-\d\d)\.ccby_.*\.tab")
+_FILE_VERSION_PATTERN = re.compile(r"hemonc_\w+_(.*)\.csv")
+
 
 class HemOncPaths(NamedTuple):
     """Container for HemOnc file paths.
@@ -43,13 +49,13 @@ class HemOncData(DataSource):
         :raise RemoteDataError: if unable to parse version number from data file
         """
         data_url = "https://dataverse.harvard.edu/api/datasets/export?persistentId=doi:10.7910/DVN/9CY9C6&exporter=dataverse_json"
-        r = requests.get(data_url, timeout=HTTPS_REQUEST_TIMEOUT)
+        r = HTTP_SESSION.get(data_url, timeout=HTTPS_REQUEST_TIMEOUT)
         r.raise_for_status()
         try:
-            first_file_name = r.json()["datasetVersion"]["files"][0]["label"]
-            date = re.match(
-                r"(\d\d\d\d-\d\d-\d\d)\.ccby_.*\.tab", first_file_name
-            ).groups()[0]
+            first_file_name = load_json(r.content)["datasetVersion"]["files"][0][
+                "label"
+            ]
+            date = _RELEASE_FILE_PATTERN.match(first_file_name).groups()[0]
         except (KeyError, IndexError, AttributeError) as e:
             msg = "Unable to parse latest HemOnc version number from release API"
             raise RemoteDataError(msg) from e
@@ -101,7 +107,7 @@ class HemOncData(DataSource):
         :return: HemOnc file paths and their version
         """
         concepts_path = get_latest_local_file(self.data_dir, "hemonc_concepts_*.csv")
-        version = parse_file_version(concepts_path, f"{self._src_name}_\\w+_(.*).csv")
+        version = parse_file_version(concepts_path, _FILE_VERSION_PATTERN)
         rels_path = get_latest_local_file(self.data_dir, f"hemonc_rels_{version}.csv")
         synonyms_path = get_latest_local_file(
             self.data_dir, f"hemonc_synonyms_{version}.csv"
@@ -3,10 +3,13 @@
 import datetime
 from pathlib import Path
 
-import requests
-
 from wags_tails.base_source import DataSource, RemoteDataError
-from wags_tails.utils.downloads import HTTPS_REQUEST_TIMEOUT, download_http
+from wags_tails.utils.downloads import (
+    HTTP_SESSION,
+    HTTPS_REQUEST_TIMEOUT,
+    download_http,
+    load_json,
+)
 from wags_tails.utils.versioning import DATE_VERSION_PATTERN
 
 
@@ -25,13 +28,13 @@ class HgncData(DataSource):
 
         :return: latest release value
         """
-        r = requests.get(
+        r = HTTP_SESSION.get(
             "https://rest.genenames.org/info",
             timeout=HTTPS_REQUEST_TIMEOUT,
             headers={"Accept": "application/json"},
         )
         r.raise_for_status()
-        r_json = r.json()
+        r_json = load_json(r.content)
         try:
             date = r_json["lastModified"]
         except KeyError as e:
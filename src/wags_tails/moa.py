@@ -3,10 +3,14 @@
 import datetime
 from pathlib import Path
 
-import requests
-
 from wags_tails.base_source import DataSource
-from wags_tails.utils.downloads import HTTPS_REQUEST_TIMEOUT, download_http, handle_zip
+from wags_tails.utils.downloads import (
+    HTTP_SESSION,
+    HTTPS_REQUEST_TIMEOUT,
+    download_http,
+    handle_zip,
+    load_json,
+)
 from wags_tails.utils.versioning import DATE_VERSION_PATTERN
 
 
@@ -23,12 +27,12 @@ class MoaData(DataSource):
 
         :return: latest release value
         """
-        response = requests.get(
+        response = HTTP_SESSION.get(
             "https://api.github.com/repos/vanallenlab/moalmanac-db/releases",
             timeout=HTTPS_REQUEST_TIMEOUT,
         )
         response.raise_for_status()
-        data = response.json()
+        data = load_json(response.content)
         return (
             datetime.datetime.strptime(data[0]["tag_name"], self._src_date_fmt)
             .replace(tzinfo=datetime.UTC)
@@ -2,17 +2,23 @@
 
 import datetime
 import logging
+import re
 from pathlib import Path
 
-import requests
-
 from .base_source import GitHubDataSource, RemoteDataError
-from .utils.downloads import HTTPS_REQUEST_TIMEOUT, download_http
+from .utils.downloads import (
+    HTTP_SESSION,
+    HTTPS_REQUEST_TIMEOUT,
+    download_http,
+    load_json,
+)
 from .utils.storage import get_latest_local_file
 from .utils.versioning import DATE_VERSION_PATTERN, parse_file_version
 
 _logger = logging.getLogger(__name__)
 
+_FILE_VERSION_PATTERN = re.compile(r"mondo_(.*)\.obo")
+
 
 class MondoData(GitHubDataSource):
     """Provide access to Mondo disease ontology data."""
@@ -32,9 +38,9 @@ class MondoData(GitHubDataSource):
         latest_url = (
             "https://api.github.com/repos/monarch-initiative/mondo/releases/latest"
         )
-        response = requests.get(latest_url, timeout=HTTPS_REQUEST_TIMEOUT)
+        response = HTTP_SESSION.get(latest_url, timeout=HTTPS_REQUEST_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
+        data = load_json(response.content)
         raw_version = data["tag_name"]
         version = (
             datetime.datetime.strptime(raw_version, "v%Y-%m-%d")
@@ -87,7 +93,7 @@ class MondoData(GitHubDataSource):
 
         if from_local:
             local_file = get_latest_local_file(self.data_dir, "mondo_*.obo")
-            return local_file, parse_file_version(local_file, r"mondo_(.*).obo")
+            return local_file, parse_file_version(local_file, _FILE_VERSION_PATTERN)
 
         latest_version, data_url = self._get_latest_version()
         latest_file = self.data_dir / f"mondo_{latest_version}.obo"
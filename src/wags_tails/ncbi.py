@@ -13,6 +13,10 @@ from wags_tails.utils.versioning import parse_file_version
 
 _logger = logging.getLogger(__name__)
 
+_ANNOTATION_DIR_PATTERN = re.compile(r"GCF_\d+\.\d+_GRCh\d+.+")
+_GENOME_FILE_PATTERN = re.compile(r"GCF_\d+\.\d+_(GRCh\d+\.\w\d+)_genomic\.gff\.gz")
+_GENE_INFO_FILE_PATTERN = re.compile(r"ncbi_info_(\d{8})\.tsv")
+
 
 class NcbiGenomeData(DataSource):
     """Provide access to NCBI genome file."""
@@ -32,9 +36,8 @@ class NcbiGenomeData(DataSource):
             "genomes/refseq/vertebrate_mammalian/Homo_sapiens/"
             "latest_assembly_versions"
         )
-        major_annotation_pattern = r"GCF_\d+\.\d+_GRCh\d+.+"
         try:
-            grch_dirs = [d for d in ftp.nlst() if re.match(major_annotation_pattern, d)]
+            grch_dirs = [d for d in ftp.nlst() if _ANNOTATION_DIR_PATTERN.match(d)]
             grch_dir = grch_dirs[0]
         except (IndexError, AttributeError) as e:
             msg = (
@@ -48,12 +51,11 @@ class NcbiGenomeData(DataSource):
 
         :return: latest release value
         """
-        file_pattern = r"GCF_\d+\.\d+_(GRCh\d+\.\w\d+)_genomic.gff.gz"
         with ftplib.FTP("ftp.ncbi.nlm.nih.gov") as ftp:
             ftp.login()
             self._navigate_ftp(ftp)
             for file in ftp.nlst():
-                match = re.match(file_pattern, file)
+                match = _GENOME_FILE_PATTERN.match(file)
                 if match and match.groups():
                     return match.groups()[0]
         msg = "No files matching expected NCBI GRCh38 annotation pattern"
@@ -160,7 +162,7 @@ class NcbiGeneData(DataSource):
             info_path = get_latest_local_file(self.data_dir, "ncbi_info_*.tsv")
             history_path = get_latest_local_file(self.data_dir, "ncbi_history_*.tsv")
             file_paths = NcbiGenePaths(gene_info=info_path, gene_history=history_path)
-            return file_paths, parse_file_version(info_path, r"ncbi_info_(\d{8}).tsv")
+            return file_paths, parse_file_version(info_path, _GENE_INFO_FILE_PATTERN)
 
         latest_version = self._get_latest_version()
         info_path = self.data_dir / f"ncbi_info_{latest_version}.tsv"
@@ -3,10 +3,10 @@
 import re
 from pathlib import Path
 
-import requests
-
 from .base_source import DataSource, RemoteDataError
-from .utils.downloads import HTTPS_REQUEST_TIMEOUT, download_http
+from .utils.downloads import HTTP_SESSION, HTTPS_REQUEST_TIMEOUT, download_http
+
+_DATE_PATTERN = re.compile(r"\d\d\d\d-\d\d-\d\d")
 
 
 class NcbiLrgRefSeqGeneData(DataSource):
@@ -22,7 +22,7 @@ class NcbiLrgRefSeqGeneData(DataSource):
         :raise RemoteDataError: if unable to parse version number from file directory
         """
         url = "https://ftp.ncbi.nlm.nih.gov/refseq/H_sapiens/RefSeqGene/"
-        response = requests.get(url, timeout=HTTPS_REQUEST_TIMEOUT)
+        response = HTTP_SESSION.get(url, timeout=HTTPS_REQUEST_TIMEOUT)
         response.raise_for_status()
         text = response.text
         for row in text.split("\n"):
@@ -31,7 +31,7 @@ class NcbiLrgRefSeqGeneData(DataSource):
         else:
             msg = f"Unable to parse LRG_RefSeqGene updated date from directory at {url}"
             raise RemoteDataError(msg)
-        match = re.findall(r"\d\d\d\d-\d\d-\d\d", row)
+        match = _DATE_PATTERN.findall(row)
         if not match:
             msg = f"Unable to parse LRG_RefSeqGene updated date from directory at {url}"
             raise RemoteDataError(msg)
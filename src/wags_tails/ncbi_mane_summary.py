@@ -2,10 +2,13 @@
 
 from pathlib import Path
 
-import requests
-
 from .base_source import DataSource, RemoteDataError
-from .utils.downloads import HTTPS_REQUEST_TIMEOUT, download_http, handle_gzip
+from .utils.downloads import (
+    HTTP_SESSION,
+    HTTPS_REQUEST_TIMEOUT,
+    download_http,
+    handle_gzip,
+)
 
 
 class NcbiManeSummaryData(DataSource):
@@ -21,7 +24,7 @@ class NcbiManeSummaryData(DataSource):
         :raise RemoteDataError: if unable to parse version number from README
         """
         latest_readme_url = "https://ftp.ncbi.nlm.nih.gov/refseq/MANE/MANE_human/current/README_versions.txt"
-        response = requests.get(latest_readme_url, timeout=HTTPS_REQUEST_TIMEOUT)
+        response = HTTP_SESSION.get(latest_readme_url, timeout=HTTPS_REQUEST_TIMEOUT)
         response.raise_for_status()
         text = response.text
         try:
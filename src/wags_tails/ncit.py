@@ -3,10 +3,15 @@
 import re
 from pathlib import Path
 
-import requests
-
 from .base_source import DataSource, RemoteDataError
-from .utils.downloads import HTTPS_REQUEST_TIMEOUT, download_http, handle_zip
+from .utils.downloads import (
+    HTTP_SESSION,
+    HTTPS_REQUEST_TIMEOUT,
+    download_http,
+    handle_zip,
+)
+
+_RELEASE_VERSION_PATTERN = re.compile(r"^\s*Version:(\d\d\.\d\d\w)", re.MULTILINE)
 
 
 class NcitData(DataSource):
@@ -22,21 +27,16 @@ class NcitData(DataSource):
         :return: latest release value
         :raise RemoteDataError: if unable to parse version number from releases API
         """
-        r = requests.get(
+        r = HTTP_SESSION.get(
             "https://ncithesaurus.nci.nih.gov/ncitbrowser/",
             timeout=HTTPS_REQUEST_TIMEOUT,
         )
         r.raise_for_status()
-        r_text = r.text.split("\n")
-        pattern = re.compile(r"Version:(\d\d\.\d\d\w)")
-        for line in r_text:
-            if "Version" in line:
-                match = re.match(pattern, line.strip())
-                if match and match.groups():
-                    return match.groups()[0]
-        else:
-            msg = "Unable to parse latest NCIt version number homepage HTML."
-            raise RemoteDataError(msg)
+        match = _RELEASE_VERSION_PATTERN.search(r.text)
+        if match:
+            return match.group(1)
+        msg = "Unable to parse latest NCIt version number homepage HTML."
+        raise RemoteDataError(msg)
 
     @staticmethod
     def _get_url(version: str) -> str:
@@ -52,14 +52,14 @@ class NcitData(DataSource):
         # ping base NCIt directory
         release_fname = f"Thesaurus_{version}.OWL.zip"
         src_url = f"{base_url}/{release_fname}"
-        r_try = requests.get(src_url, timeout=HTTPS_REQUEST_TIMEOUT)
+        r_try = HTTP_SESSION.get(src_url, timeout=HTTPS_REQUEST_TIMEOUT)
         if r_try.status_code != 200:
             # ping NCIt archive directories
             archive_url = f"{base_url}/archive/{version}_Release/{release_fname}"
-            archive_try = requests.get(archive_url, timeout=HTTPS_REQUEST_TIMEOUT)
+            archive_try = HTTP_SESSION.get(archive_url, timeout=HTTPS_REQUEST_TIMEOUT)
             if archive_try.status_code != 200:
                 old_archive_url = f"{base_url}/archive/20{version[0:2]}/{version}_Release/{release_fname}"
-                old_archive_try = requests.get(
+                old_archive_try = HTTP_SESSION.get(
                     old_archive_url, timeout=HTTPS_REQUEST_TIMEOUT
                 )
                 if old_archive_try.status_code != 200:
@@ -3,10 +3,13 @@
 import datetime
 from pathlib import Path
 
-import requests
-
 from .base_source import DataSource, RemoteDataError
-from .utils.downloads import HTTPS_REQUEST_TIMEOUT, download_http
+from .utils.downloads import (
+    HTTP_SESSION,
+    HTTPS_REQUEST_TIMEOUT,
+    download_http,
+    load_json,
+)
 from .utils.versioning import DATE_VERSION_PATTERN
 
 
@@ -23,12 +26,12 @@ class OncoTreeData(DataSource):
         :raise RemoteDataError: if unable to parse version number from API response
         """
         info_url = "http://oncotree.info/api/versions"
-        response = requests.get(info_url, timeout=HTTPS_REQUEST_TIMEOUT)
+        response = HTTP_SESSION.get(info_url, timeout=HTTPS_REQUEST_TIMEOUT)
         response.raise_for_status()
         try:
             raw_version = next(
                 r["release_date"]
-                for r in response.json()
+                for r in load_json(response.content)
                 if r["api_identifier"] == "oncotree_latest_stable"
             )
         except StopIteration as e:
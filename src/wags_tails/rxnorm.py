@@ -2,14 +2,17 @@
 
 import datetime
 import os
+import shutil
 import zipfile
 from pathlib import Path
 
 import requests
 
 from .base_source import DataSource, RemoteDataError
-from .utils.downloads import HTTPS_REQUEST_TIMEOUT, download_http
-from .utils.versioning import DATE_VERSION_PATTERN
+from .utils.downloads import IO_CHUNK_SIZE, download_http, load_json
+from .utils.versioning import DATE_VERSION_PATTERN, cache_version, fetch_latest_version
+
+_MISSING_API_KEY_MSG = "Must provide UMLS API key in environment variable UMLS_API_KEY. See: https://documentation.uts.nlm.nih.gov/rest/authentication.html"
 
 
 class RxNormData(DataSource):
@@ -23,26 +26,37 @@ class RxNormData(DataSource):
     _filetype = "RRF"
 
     @staticmethod
-    def _get_latest_version() -> str:
-        """Retrieve latest version value
+    def _parse_latest_version(r: requests.Response) -> str:
+        """Parse latest version value from version API response
 
+        :param r: response from version API
         :return: latest release value
-        :raise RemoteDataError: if unable to parse version number from releases API
+        :raise RemoteDataError: if unable to parse version number from response
         """
-        url = "https://rxnav.nlm.nih.gov/REST/version.json"
-        r = requests.get(url, timeout=HTTPS_REQUEST_TIMEOUT)
-        r.raise_for_status()
         try:
-            raw_version = r.json()["version"]
+            raw_version = load_json(r.content)["version"]
             return (
                 datetime.datetime.strptime(raw_version, "%d-%b-%Y")
                 .replace(tzinfo=datetime.UTC)
                 .strftime(DATE_VERSION_PATTERN)
             )
         except (ValueError, KeyError) as e:
-            msg = f"Unable to parse latest RxNorm version from API endpoint: {url}."
+            msg = f"Unable to parse latest RxNorm version from API endpoint: {r.url}."
             raise RemoteDataError(msg) from e
 
+    @cache_version()
+    def _get_latest_version(self) -> str:
+        """Retrieve latest version value
+
+        :return: latest release value
+        :raise RemoteDataError: if unable to parse version number from releases API
+        """
+        return fetch_latest_version(
+            "https://rxnav.nlm.nih.gov/REST/version.json",
+            self.data_dir,
+            self._parse_latest_version,
+        )
+
     def _zip_handler(self, dl_path: Path, outfile_path: Path) -> None:
         """Provide simple callback function to extract the largest file within a given
         zipfile and save it within the appropriate data directory.
@@ -52,16 +66,15 @@ class RxNormData(DataSource):
         :raise RemoteDataError: if unable to locate RRF file
         """
         with zipfile.ZipFile(dl_path, "r") as zip_ref:
-            for file in zip_ref.filelist:
-                if file.filename == "rrf/RXNCONSO.RRF":
-                    file.filename = outfile_path.name
-                    target = file
-                    break
-            else:
+            target = next(
+                (f for f in zip_ref.infolist() if f.filename == "rrf/RXNCONSO.RRF"),
+                None,
+            )
+            if target is None:
                 msg = "Unable to find RxNorm RRF in downloaded file"
                 raise RemoteDataError(msg)
-            zip_ref.extract(target, path=outfile_path.parent)
-        dl_path.unlink()
+            with zip_ref.open(target) as src, outfile_path.open("wb") as dst:
+                shutil.copyfileobj(src, dst, IO_CHUNK_SIZE)
 
     def _download_data(self, version: str, file_path: Path) -> None:
         """Download latest RxNorm data file.
@@ -72,8 +85,7 @@ class RxNormData(DataSource):
         """
         api_key = os.environ.get("UMLS_API_KEY")
         if not api_key:
-            msg = "Must provide UMLS API key in environment variable UMLS_API_KEY. See: https://documentation.uts.nlm.nih.gov/rest/authentication.html"
-            raise RemoteDataError(msg)
+            raise RemoteDataError(_MISSING_API_KEY_MSG)
         fmt_version = (
             datetime.datetime.strptime(version, DATE_VERSION_PATTERN)
             .replace(tzinfo=datetime.UTC)
@@ -85,3 +97,29 @@ class RxNormData(DataSource):
         download_http(
             url, file_path, handler=self._zip_handler, tqdm_params=self._tqdm_params
         )
+
+    def get_latest(
+        self, from_local: bool = False, force_refresh: bool = False
+    ) -> tuple[Path, str]:
+        """Get path to latest version of data.
+
+        If a download will certainly be needed (i.e. ``force_refresh`` is set, or no
+        local data is available), check for a UMLS API key before making any requests.
+
+        :param from_local: if True, use latest available local file
+        :param force_refresh: if True, fetch and return data from remote regardless of
+            whether a local copy is present
+        :return: Path to location of data, and version value of it
+        :raise ValueError: if both ``force_refresh`` and ``from_local`` are True
+        :raise RemoteDataError: if data must be downloaded but API key is not defined
+            in the environment
+        """
+        if (
+            not from_local
+            and not os.environ.get("UMLS_API_KEY")
+            and (force_refresh or not any(self.data_dir.glob("rxnorm_*.RRF")))
+        ):
+            raise RemoteDataError(_MISSING_API_KEY_MSG)
+        if force_refresh:
+            self._get_latest_version.cache_clear()
+        return super().get_latest(from_local, force_refresh)
@@ -1,40 +1,93 @@
 """Provide helper functions for downloading data."""
 
+import contextlib
 import ftplib
 import gzip
+import io
 import logging
 import os
 import re
+import shutil
 import tempfile
 import zipfile
 from collections.abc import Callable
 from pathlib import Path
+from typing import BinaryIO
 
 import requests
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from urllib3.util import Retry
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 _logger = logging.getLogger(__name__)
 
 
 HTTPS_REQUEST_TIMEOUT = 30
 
+# Parse JSON from raw response bytes, using orjson if the optional ``fast`` extra is
+# installed, and the standard library otherwise
+load_json = _json.loads
+
+# Buffer size for reading/copying large file streams, e.g. HTTP responses or archives
+IO_CHUNK_SIZE = 1024 * 1024
+
+
+def _create_session() -> requests.Session:
+    """Create an HTTP session that retries on rate limiting and transient server
+    errors, with exponential backoff, and retains open connections to each host.
+
+    :return: configured session
+    """
+    retries = Retry(
+        total=5,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        raise_on_status=False,
+    )
+    # keep a connection pool for each host that a full multi-source run may contact,
+    # rather than requests' default of 10, so pools aren't evicted partway through
+    adapter = HTTPAdapter(pool_connections=32, max_retries=retries)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared by all HTTP requests, so that connections to a host are kept alive and reused
+HTTP_SESSION = _create_session()
+
+
+def _make_temp_path() -> Path:
+    """Create a uniquely-named temporary file to download into, so that concurrent
+    downloads don't overwrite each other.
+
+    :return: path to new, empty temporary file
+    """
+    fd, name = tempfile.mkstemp(prefix="wags_tails_")
+    os.close(fd)
+    return Path(name)
+
 
-def handle_zip(dl_path: Path, outfile_path: Path) -> None:
+def handle_zip(dl_path: Path | BinaryIO, outfile_path: Path) -> None:
     """Extract the largest file within a given zipfile and save it within the
     appropriate data directory. Can be passed as a callback to a downloader method.
 
-    :param dl_path: path to temp data file
+    :param dl_path: path to temp data file, or a binary file object containing the
+        zipfile (e.g. an in-memory download)
     :param outfile_path: path to save file within
     """
     with zipfile.ZipFile(dl_path, "r") as zip_ref:
-        if len(zip_ref.filelist) > 1:
-            files = sorted(zip_ref.filelist, key=lambda z: z.file_size, reverse=True)
-            target = files[0]
-        else:
-            target = zip_ref.filelist[0]
-        target.filename = outfile_path.name
-        zip_ref.extract(target, path=outfile_path.parent)
-    dl_path.unlink()
+        target = max(zip_ref.infolist(), key=lambda z: z.file_size)
+        with zip_ref.open(target) as src, outfile_path.open("wb") as dst:
+            shutil.copyfileobj(src, dst, IO_CHUNK_SIZE)
+    if isinstance(dl_path, Path):
+        dl_path.unlink()
 
 
 def handle_gzip(dl_path: Path, outfile_path: Path) -> None:
@@ -69,31 +122,34 @@ def download_ftp(
     if not tqdm_params:
         tqdm_params = {}
     _logger.info("Downloading %s from %s...", outfile_path.name, host)
-    if handler:
-        dl_path = Path(tempfile.gettempdir()) / "wags_tails_tmp"
-    else:
-        dl_path = outfile_path
-    with ftplib.FTP(host) as ftp:
-        ftp.login()
-        _logger.debug("FTP login to %s was successful.", host)
-        ftp.cwd(host_directory_path)
-        file_size = ftp.size(host_filename)
-        if not tqdm_params.get("disable"):
-            print(f"Downloading {host}/{host_directory_path}{host_filename}...")
-        with (
-            dl_path.open("wb") as fp,
-            tqdm(total=file_size, **tqdm_params) as progress_bar,
-        ):
-
-            def _cb(data: bytes) -> None:
-                progress_bar.update(len(data))
-                fp.write(data)
-                if fp.tell() == file_size:
-                    progress_bar.close()
-
-            ftp.retrbinary(f"RETR {host_filename}", _cb)
-    if handler:
-        handler(dl_path, outfile_path)
+    temp_path = _make_temp_path() if handler else None
+    dl_path = temp_path or outfile_path
+    try:
+        with ftplib.FTP(host) as ftp:
+            ftp.login()
+            _logger.debug("FTP login to %s was successful.", host)
+            ftp.cwd(host_directory_path)
+            file_size = ftp.size(host_filename)
+            if not tqdm_params.get("disable"):
+                print(f"Downloading {host}/{host_directory_path}{host_filename}...")
+            with (
+                dl_path.open("wb") as fp,
+                tqdm(total=file_size, **tqdm_params) as progress_bar,
+            ):
+
+                def _cb(data: bytes) -> None:
+                    progress_bar.update(len(data))
+                    fp.write(data)
+                    if fp.tell() == file_size:
+                        progress_bar.close()
+
+                ftp.retrbinary(f"RETR {host_filename}", _cb)
+        if handler:
+            handler(dl_path, outfile_path)
+    finally:
+        # remove the temp file even if the download or handler fails
+        if temp_path:
+            temp_path.unlink(missing_ok=True)
     _logger.info("Successfully downloaded %s.", outfile_path.name)
 
 
@@ -101,8 +157,11 @@ def download_http(
     url: str,
     outfile_path: Path,
     headers: dict | None = None,
-    handler: Callable[[Path, Path], None] | None = None,
+    handler: Callable[[Path, Path], None]
+    | Callable[[BinaryIO, Path], None]
+    | None = None,
     tqdm_params: dict | None = None,
+    in_memory: bool = False,
 ) -> None:
     """Perform HTTP download of remote data file.
 
@@ -113,35 +172,47 @@ def download_http(
     :param handler: provide if downloaded file requires additional action, e.g.
         it's a zip file.
     :param tqdm_params: Optional TQDM configuration.
+    :param in_memory: if True and ``handler`` is given, hold the download in memory
+        rather than writing it to a temporary file, and pass the handler a binary file
+        object in place of a path. Only suitable for moderately-sized files.
     """
     if not tqdm_params:
         tqdm_params = {}
     _logger.info("Downloading %s from %s...", outfile_path.name, url)
-    if handler:
-        dl_path = Path(tempfile.gettempdir()) / "wags_tails_tmp"
-    else:
-        dl_path = outfile_path
-    # use stream to avoid saving download completely to memory
-    with requests.get(
-        url, stream=True, headers=headers, timeout=HTTPS_REQUEST_TIMEOUT
-    ) as r:
-        r.raise_for_status()
-        total_size = int(r.headers.get("content-length", 0))
-        if not tqdm_params.get("disable"):
-            if "apiKey" in url:  # don't print RxNorm API key
-                pattern = r"&apiKey=.{8}-.{4}-.{4}-.{4}-.{12}"
-                print_url = re.sub(pattern, "", os.path.basename(url))  # noqa: PTH119
-                print(f"Downloading {print_url}...")
-            else:
-                print(f"Downloading {os.path.basename(url)}...")  # noqa: PTH119
-        with (
-            dl_path.open("wb") as h,
-            tqdm(total=total_size, **tqdm_params) as progress_bar,
-        ):
-            for chunk in r.iter_content(chunk_size=8192):
-                if chunk:
-                    h.write(chunk)
-                    progress_bar.update(len(chunk))
-    if handler:
-        handler(dl_path, outfile_path)
+    buffer = io.BytesIO() if handler and in_memory else None
+    temp_path = _make_temp_path() if handler and buffer is None else None
+    dl_path = temp_path or outfile_path
+    try:
+        # use stream to avoid saving download completely to memory
+        with HTTP_SESSION.get(
+            url, stream=True, headers=headers, timeout=HTTPS_REQUEST_TIMEOUT
+        ) as r:
+            r.raise_for_status()
+            total_size = int(r.headers.get("content-length", 0))
+            if not tqdm_params.get("disable"):
+                if "apiKey" in url:  # don't print RxNorm API key
+                    pattern = r"&apiKey=.{8}-.{4}-.{4}-.{4}-.{12}"
+                    print_url = re.sub(pattern, "", os.path.basename(url))  # noqa: PTH119
+                    print(f"Downloading {print_url}...")
+                else:
+                    print(f"Downloading {os.path.basename(url)}...")  # noqa: PTH119
+            with (
+                contextlib.nullcontext(buffer)
+                if buffer is not None
+                else dl_path.open("wb") as h,
+                tqdm(total=total_size, **tqdm_params) as progress_bar,
+            ):
+                for chunk in r.iter_content(chunk_size=IO_CHUNK_SIZE):
+                    if chunk:
+                        h.write(chunk)
+                        progress_bar.update(len(chunk))
+        if buffer is not None:
+            buffer.seek(0)
+            handler(buffer, outfile_path)
+        elif handler:
+            handler(dl_path, outfile_path)
+    finally:
+        # remove the temp file even if the download or handler fails
+        if temp_path:
+            temp_path.unlink(missing_ok=True)
     _logger.info("Successfully downloaded %s.", outfile_path.name)
@@ -0,0 +1,76 @@
+"""Maintain a small on-disk index of the latest locally-available data files.
+
+Identifying the most recent local file for some sources requires listing the data
+directory and parsing and comparing every matching filename. The index records the
+result of each such scan, so that later lookups can skip the directory scan entirely
+as long as the directory hasn't been modified since. Downloading new data modifies
+the directory, so the next lookup afterward rescans it, rather than assuming that the
+new file is the most recent one available locally.
+"""
+
+import logging
+from pathlib import Path
+
+from .metadata import get_metadata_dir, read_metadata, write_metadata
+
+_logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "local_index.json"
+
+
+def get_latest_local(data_dir: Path, src_name: str) -> tuple[Path, str] | None:
+    """Look up the most recent locally-available file for a source in the index.
+
+    An index entry is only trusted if the data directory hasn't been modified since
+    it was written, i.e. no files have been added, removed, or renamed.
+
+    :param data_dir: source data directory
+    :param src_name: name of source
+    :return: Path to most recent file and its version, or None if no valid index
+        entry is available
+    """
+    entry = read_metadata(data_dir, INDEX_FILENAME).get(src_name)
+    if not isinstance(entry, dict):
+        return None
+    file_name = entry.get("file")
+    version = entry.get("latest_version")
+    if not isinstance(file_name, str) or not isinstance(version, str):
+        _logger.debug("Ignoring malformed local file index entry for %s.", src_name)
+        return None
+    if entry.get("mtime") != data_dir.stat().st_mtime_ns:
+        _logger.debug("Local file index for %s is out of date.", src_name)
+        return None
+    file_path = data_dir / file_name
+    if not file_path.exists():
+        return None
+    return file_path, version
+
+
+def update_local_index(
+    data_dir: Path, src_name: str, file_path: Path, version: str
+) -> None:
+    """Record the most recent locally-available file for a source.
+
+    The index is only an optimization, so failure to write it (e.g. because the data
+    directory is read-only) is logged and otherwise ignored.
+
+    :param data_dir: source data directory
+    :param src_name: name of source
+    :param file_path: location of most recent file
+    :param version: version of most recent file
+    """
+    try:
+        # creating the metadata directory modifies the data directory, so make sure
+        # it exists before reading mtime
+        get_metadata_dir(data_dir)
+        mtime = data_dir.stat().st_mtime_ns
+    except OSError as e:
+        _logger.debug("Unable to update local file index in %s: %s", data_dir, e)
+        return
+    index = read_metadata(data_dir, INDEX_FILENAME)
+    index[src_name] = {
+        "latest_version": version,
+        "file": file_path.name,
+        "mtime": mtime,
+    }
+    write_metadata(data_dir, INDEX_FILENAME, index)
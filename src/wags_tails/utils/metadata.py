@@ -0,0 +1,72 @@
+"""Read and write metadata kept alongside a source's data files.
+
+Metadata, like the local file index or stored remote version lookups, is saved as
+JSON files within a hidden subdirectory of the source data directory. Keeping it out
+of the data directory proper means that, once the subdirectory exists, writing
+metadata doesn't change the data directory's modification time.
+
+Metadata is only ever an optimization, so failure to read it is treated as if it were
+absent, and failure to write it is logged and otherwise ignored (e.g. when the data
+directory is read-only).
+"""
+
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+_logger = logging.getLogger(__name__)
+
+METADATA_DIRNAME = ".wags_tails"
+
+
+def get_metadata_dir(data_dir: Path) -> Path:
+    """Get location of metadata files, creating it if necessary.
+
+    :param data_dir: source data directory
+    :return: path to metadata directory
+    :raise OSError: if the metadata directory doesn't exist and can't be created
+    """
+    metadata_dir = data_dir / METADATA_DIRNAME
+    metadata_dir.mkdir(exist_ok=True)
+    return metadata_dir
+
+
+def read_metadata(data_dir: Path, name: str) -> dict:
+    """Load contents of a metadata file.
+
+    :param data_dir: source data directory
+    :param name: name of metadata file
+    :return: metadata contents, or an empty dict if unavailable or malformed
+    """
+    try:
+        with (data_dir / METADATA_DIRNAME / name).open() as f:
+            metadata = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return metadata if isinstance(metadata, dict) else {}
+
+
+def write_metadata(data_dir: Path, name: str, metadata: dict) -> None:
+    """Save contents of a metadata file.
+
+    Contents are written to a temporary file which then replaces the original, so
+    that an interrupted write can't leave a partial file behind.
+
+    :param data_dir: source data directory
+    :param name: name of metadata file
+    :param metadata: JSON-serializable contents to save
+    """
+    try:
+        metadata_dir = get_metadata_dir(data_dir)
+        fd, tmp_name = tempfile.mkstemp(dir=metadata_dir, prefix=f".{name}.")
+        tmp_path = Path(tmp_name)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(metadata, f)
+            tmp_path.replace(metadata_dir / name)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+    except OSError as e:
+        _logger.debug("Unable to write %s metadata in %s: %s", name, data_dir, e)
@@ -1,22 +1,153 @@
 """Basic utilities pertaining to data versioning."""
 
+import functools
 import re
+import time
+from collections.abc import Callable
+from http import HTTPStatus
 from pathlib import Path
+from typing import Any, ParamSpec, TypeVar
+
+import requests
+
+from .. import __version__
+from .downloads import HTTP_SESSION, HTTPS_REQUEST_TIMEOUT
+from .metadata import read_metadata, write_metadata
 
 # Always format date-based versions as YYYYMMDD
 DATE_VERSION_PATTERN = "%Y%m%d"
 
+# Default number of seconds to reuse a fetched latest-version value
+VERSION_CACHE_TTL = 300
+
+# Name of metadata file that stores remote version lookups
+VERSION_CACHE_FILENAME = "versions.json"
+
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
 
-def parse_file_version(file_path: Path, pattern: str) -> str:
+_VERSION_CACHE: dict[str, tuple[float, Any]] = {}
+
+
+def parse_file_version(file_path: Path, pattern: str | re.Pattern) -> str:
     """Extract data version from file.
 
     :param file_path: location of file to get version from
-    :param pattern: custom parsing pattern
+    :param pattern: custom parsing pattern, either as a string or precompiled
     :return: version value
     :raise ValueError: if unable to parse version from file
     """
-    match = re.match(pattern, file_path.name)
+    if isinstance(pattern, str):
+        pattern = re.compile(pattern)
+    match = pattern.match(file_path.name)
     if match and match.groups():
         return match.groups()[0]
     msg = f"Unable to parse version from {file_path.absolute()}"
     raise ValueError(msg)
+
+
+def numeric_version_key(version: str) -> tuple[int, ...]:
+    """Get sort key for a dot-separated numeric version value, so that versions are
+    ordered by each numeric component rather than lexically (e.g. ``"5.1.10"`` follows
+    ``"5.1.9"``).
+
+    :param version: version value, e.g. ``"5.1.10"``
+    :return: version components, as integers
+    :raise ValueError: if any version component isn't an integer
+    """
+    return tuple(int(part) for part in version.split("."))
+
+
+def cache_version(
+    ttl: float = VERSION_CACHE_TTL,
+) -> Callable[[Callable[_P, _T]], Callable[_P, _T]]:
+    """Cache the result of a latest-version lookup for the remainder of the process,
+    up to ``ttl`` seconds.
+
+    Values are keyed by the wrapped function alone, not by its arguments, so this
+    should only decorate lookups whose result doesn't depend on them (e.g. a source
+    class's ``_get_latest_version()`` method). As with ``functools.lru_cache``, the
+    decorated function gains a ``cache_clear()`` method to discard its cached value,
+    e.g. so that a forced refresh always checks the remote.
+
+    :param ttl: number of seconds a cached value remains valid
+    :return: decorator to apply to a version lookup function
+    """
+
+    def decorator(func: Callable[_P, _T]) -> Callable[_P, _T]:
+        key = f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _T:
+            cached = _VERSION_CACHE.get(key)
+            if cached and time.monotonic() - cached[0] < ttl:
+                return cached[1]
+            value = func(*args, **kwargs)
+            _VERSION_CACHE[key] = (time.monotonic(), value)
+            return value
+
+        wrapper.cache_clear = lambda: _VERSION_CACHE.pop(key, None)
+        return wrapper
+
+    return decorator
+
+
+def clear_version_cache() -> None:
+    """Discard all cached latest-version values."""
+    _VERSION_CACHE.clear()
+
+
+def fetch_latest_version(
+    url: str, data_dir: Path, parse_response: Callable[[requests.Response], _T]
+) -> _T:
+    """Get the latest version value from a remote endpoint with a conditional request.
+
+    The value parsed from the most recent full response is stored as metadata in the
+    data directory, along with the response's ``ETag`` and ``Last-Modified`` headers.
+    Later requests send these back, and if the remote reports that nothing has changed
+    (``304 Not Modified``), the stored value is returned without transferring or
+    parsing the response body again.
+
+    Stored values are tagged with the wags-tails version that parsed them, and values
+    from any other version are ignored, so that a change to a parser's output can't
+    be masked by an older stored value.
+
+    :param url: location of version endpoint
+    :param data_dir: source data directory, where version metadata is stored
+    :param parse_response: function to extract the version value from a full
+        response. Its result must be JSON-serializable (tuples are returned as lists
+        when read back from storage).
+    :return: latest version value
+    """
+    cache = read_metadata(data_dir, VERSION_CACHE_FILENAME)
+    cached = cache.get(url)
+    if (
+        not isinstance(cached, dict)
+        or "value" not in cached
+        or cached.get("wags_tails_version") != __version__
+    ):
+        cached = None
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    r = HTTP_SESSION.get(url, headers=headers, timeout=HTTPS_REQUEST_TIMEOUT)
+    if cached and r.status_code == HTTPStatus.NOT_MODIFIED:
+        return cached["value"]
+    r.raise_for_status()
+    value = parse_response(r)
+
+    etag = r.headers.get("ETag")
+    last_modified = r.headers.get("Last-Modified")
+    if etag or last_modified:
+        cache[url] = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "value": value,
+            "wags_tails_version": __version__,
+        }
+        write_metadata(data_dir, VERSION_CACHE_FILENAME, cache)
+    return value
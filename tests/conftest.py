@@ -5,6 +5,8 @@ from pathlib import Path
 
 import pytest
 
+from wags_tails.utils.versioning import clear_version_cache
+
 
 @pytest.fixture(scope="session")
 def mock_data_dir():
@@ -30,3 +32,9 @@ def base_data_dir():
         shutil.rmtree(str(path.absolute()))
     yield path
     shutil.rmtree(str(path.absolute()))  # clean up afterward
+
+
+@pytest.fixture(autouse=True)
+def _clear_version_cache():
+    """Ensure cached latest-version values don't leak between tests."""
+    clear_version_cache()
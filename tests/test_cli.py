@@ -0,0 +1,110 @@
+"""Test CLI application."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+import wags_tails
+from wags_tails.cli import _DATA_SOURCES, _get_data_class, cli
+
+
+def test_data_sources():
+    """Ensure CLI source names stay in sync with data classes."""
+    for source in _DATA_SOURCES:
+        assert _get_data_class(source)._src_name == source  # noqa: SLF001
+
+    exported_sources = {
+        getattr(wags_tails, name)._src_name  # noqa: SLF001
+        for name in wags_tails.__all__
+        if name not in {"CustomData", "DataSource", "RemoteDataError", "__version__"}
+    }
+    assert exported_sources == set(_DATA_SOURCES)
+
+
+def test_list_sources():
+    """Test list-sources command."""
+    result = CliRunner().invoke(cli, ["list-sources"])
+    assert result.exit_code == 0
+    assert result.output.splitlines() == list(_DATA_SOURCES)
+
+
+@pytest.fixture()
+def fetched_sources(monkeypatch: pytest.MonkeyPatch):
+    """Replace data classes with stubs that record requested sources. The ``ncit``
+    stub fails to acquire data.
+    """
+    fetched = []
+
+    def _get_stub_class(source: str) -> type:
+        class StubData:
+            def __init__(self, silent: bool) -> None:
+                self.silent = silent
+
+            def get_latest(
+                self, from_local: bool, force_refresh: bool
+            ) -> tuple[Path, str]:
+                fetched.append((source, self.silent, from_local, force_refresh))
+                if source == "ncit":
+                    msg = "Unable to parse version"
+                    raise ValueError(msg)
+                return Path(f"{source}_1.0.tsv"), "1.0"
+
+        return StubData
+
+    monkeypatch.setattr("wags_tails.cli._get_data_class", _get_stub_class)
+    return fetched
+
+
+def test_get_latest_multiple(fetched_sources: list):
+    """Test get-latest command with multiple sources, which are fetched silently."""
+    result = CliRunner().invoke(
+        cli, ["get-latest", "--from_local", "do", "mondo", "do", "hgnc"]
+    )
+    assert result.exit_code == 0
+    assert sorted(result.stdout.splitlines()) == [
+        "do_1.0.tsv",
+        "hgnc_1.0.tsv",
+        "mondo_1.0.tsv",
+    ]
+    assert sorted(fetched_sources) == [
+        ("do", True, True, False),
+        ("hgnc", True, True, False),
+        ("mondo", True, True, False),
+    ]
+
+
+def test_get_latest_multiple_failure(fetched_sources: list):
+    """Test that one source failing doesn't prevent acquisition of the others."""
+    result = CliRunner().invoke(cli, ["get-latest", "ncit", "mondo"])
+    assert result.exit_code == 1
+    assert result.stdout.splitlines() == ["mondo_1.0.tsv"]
+    assert result.stderr.splitlines() == [
+        "Unable to get latest ncit data: Unable to parse version"
+    ]
+    assert sorted(fetched_sources) == [
+        ("mondo", True, False, False),
+        ("ncit", True, False, False),
+    ]
+
+
+def test_get_latest_invalid_source():
+    """Test get-latest command with missing or unknown sources."""
+    result = CliRunner().invoke(cli, ["get-latest"])
+    assert result.exit_code == 2
+    result = CliRunner().invoke(cli, ["get-latest", "do", "unknown_source"])
+    assert result.exit_code == 2
+
+
+def test_lazy_imports():
+    """Ensure that loading the CLI doesn't import data source modules."""
+    script = (
+        "import sys, wags_tails.cli; "
+        "print(any(m.startswith(('requests', 'wags_tails.base_source')) for m in sys.modules))"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
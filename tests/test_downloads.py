@@ -0,0 +1,170 @@
+"""Test download utilities."""
+
+import ftplib
+import io
+import json
+import subprocess
+import sys
+import tempfile
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+import requests
+import requests_mock
+
+from wags_tails.utils.downloads import (
+    download_ftp,
+    download_http,
+    handle_gzip,
+    handle_zip,
+    load_json,
+)
+
+
+@pytest.fixture()
+def temp_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Direct temporary download files to an empty directory."""
+    directory = tmp_path / "tmp"
+    directory.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(directory))
+    return directory
+
+
+def _make_zip(content: bytes) -> bytes:
+    """Create zip archive containing a single file.
+
+    :param content: contents of archived file
+    :return: zip archive bytes
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zip_ref:
+        zip_ref.writestr("data.txt", content)
+    return buffer.getvalue()
+
+
+def test_download_http_concurrent_handlers(tmp_path: Path):
+    """Test that concurrent downloads with handlers don't share a temporary file."""
+    barrier = threading.Barrier(2, timeout=5)
+    dl_paths = []
+
+    def _handler(dl_path: Path, outfile_path: Path) -> None:
+        dl_paths.append(dl_path)
+        # make sure both downloads have been written before either is handled
+        barrier.wait()
+        outfile_path.write_bytes(dl_path.read_bytes())
+
+    with requests_mock.Mocker() as m:
+        m.get("https://example.org/a.txt", content=b"aaaa")
+        m.get("https://example.org/b.txt", content=b"bbbb")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(
+                    download_http,
+                    f"https://example.org/{name}.txt",
+                    tmp_path / f"{name}.txt",
+                    handler=_handler,
+                    tqdm_params={"disable": True},
+                )
+                for name in ("a", "b")
+            ]
+            for future in futures:
+                future.result()
+
+    assert len(set(dl_paths)) == 2
+    assert (tmp_path / "a.txt").read_bytes() == b"aaaa"
+    assert (tmp_path / "b.txt").read_bytes() == b"bbbb"
+
+
+def test_download_http_cleanup(tmp_path: Path, temp_dir: Path):
+    """Test that temporary download files are removed when a download fails."""
+    with requests_mock.Mocker() as m:
+        m.get("https://example.org/missing.zip", status_code=404)
+        m.get("https://example.org/bad.zip", content=b"not a zip")
+        m.get("https://example.org/good.zip", content=_make_zip(b"data"))
+
+        with pytest.raises(requests.HTTPError):
+            download_http(
+                "https://example.org/missing.zip",
+                tmp_path / "missing.txt",
+                handler=handle_zip,
+                tqdm_params={"disable": True},
+            )
+        assert list(temp_dir.iterdir()) == []
+
+        with pytest.raises(zipfile.BadZipFile):
+            download_http(
+                "https://example.org/bad.zip",
+                tmp_path / "bad.txt",
+                handler=handle_zip,
+                tqdm_params={"disable": True},
+            )
+        assert list(temp_dir.iterdir()) == []
+
+        download_http(
+            "https://example.org/good.zip",
+            tmp_path / "good.txt",
+            handler=handle_zip,
+            tqdm_params={"disable": True},
+        )
+        assert (tmp_path / "good.txt").read_bytes() == b"data"
+        assert list(temp_dir.iterdir()) == []
+
+
+def test_download_ftp_cleanup(
+    tmp_path: Path, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that temporary download files are removed when an FTP download fails."""
+
+    class StubFTP:
+        def __init__(self, host: str) -> None:
+            pass
+
+        def __enter__(self) -> "StubFTP":
+            return self
+
+        def __exit__(self, *_: object) -> None:
+            pass
+
+        def login(self) -> None:
+            msg = "530 Login incorrect."
+            raise ftplib.error_perm(msg)
+
+    monkeypatch.setattr("wags_tails.utils.downloads.ftplib.FTP", StubFTP)
+    with pytest.raises(ftplib.error_perm):
+        download_ftp(
+            "ftp.example.org",
+            "pub/",
+            "data.gz",
+            tmp_path / "data.txt",
+            handler=handle_gzip,
+            tqdm_params={"disable": True},
+        )
+    assert list(temp_dir.iterdir()) == []
+
+
+@pytest.mark.parametrize(
+    "fixture_name",
+    ["drugbank_releases.json", "hgnc_info.json", "rxnorm_release.json"],
+)
+def test_load_json(fixture_dir: Path, fixture_name: str):
+    """Test that the orjson backend parses responses like the standard library."""
+    orjson = pytest.importorskip("orjson")
+    assert load_json is orjson.loads
+    content = (fixture_dir / fixture_name).read_bytes()
+    assert load_json(content) == json.loads(content)
+
+
+def test_load_json_fallback():
+    """Test use of the standard library parser when orjson isn't installed."""
+    script = (
+        "import json, sys; sys.modules['orjson'] = None; "
+        "from wags_tails.utils.downloads import load_json; "
+        "print(load_json is json.loads, load_json(b'[1, null]'))"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "True [1, None]"
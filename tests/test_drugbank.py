@@ -1,12 +1,14 @@
 """Test DrugBank data source."""
 
 import json
+import os
 from pathlib import Path
 
 import pytest
 import requests_mock
 
 from wags_tails.drugbank import DrugBankData
+from wags_tails.utils.versioning import clear_version_cache
 
 
 @pytest.fixture()
@@ -70,22 +72,265 @@ def test_get_latest(
         assert path == drugbank_data_dir / "drugbank_5.1.12.csv"
         assert path.exists()
         assert version == "5.1.12"
-        assert m.call_count == 3
+        assert m.call_count == 2
 
         path, version = drugbank.get_latest(from_local=True)
         assert path == drugbank_data_dir / "drugbank_5.1.12.csv"
         assert path.exists()
-        assert m.call_count == 3
+        assert m.call_count == 2
+        assert (drugbank_data_dir / ".wags_tails" / "local_index.json").exists()
 
         (drugbank_data_dir / "drugbank_5.1.9.csv").touch()
         path, version = drugbank.get_latest(from_local=True)
         assert path == drugbank_data_dir / "drugbank_5.1.12.csv"
         assert path.exists()
         assert version == "5.1.12"
-        assert m.call_count == 3
+        assert m.call_count == 2
 
         path, version = drugbank.get_latest(force_refresh=True)
         assert path == drugbank_data_dir / "drugbank_5.1.12.csv"
         assert path.exists()
         assert version == "5.1.12"
+        assert m.call_count == 4
+
+        # expired/cleared version cache should require a fresh lookup
+        clear_version_cache()
+        path, version = drugbank.get_latest()
+        assert path == drugbank_data_dir / "drugbank_5.1.12.csv"
+        assert version == "5.1.12"
         assert m.call_count == 5
+
+
+def test_get_latest_force_refresh_new_release(
+    drugbank: DrugBankData,
+    drugbank_data_dir: Path,
+    versions_response: dict,
+    drugbank_file: str,
+):
+    """Test that a forced refresh sees a new release despite a cached version value."""
+    new_versions_response = json.loads(
+        json.dumps(versions_response).replace("5-1-12", "5-1-13")
+    )
+    with requests_mock.Mocker() as m:
+        m.get(
+            "https://go.drugbank.com/releases/latest.json",
+            [{"json": versions_response}, {"json": new_versions_response}],
+        )
+        m.get(
+            "https://go.drugbank.com/releases/5-1-12/downloads/all-drugbank-vocabulary",
+            content=drugbank_file,
+        )
+        m.get(
+            "https://go.drugbank.com/releases/5-1-13/downloads/all-drugbank-vocabulary",
+            content=drugbank_file,
+        )
+        path, version = drugbank.get_latest()
+        assert version == "5.1.12"
+
+        path, version = drugbank.get_latest(force_refresh=True)
+        assert path == drugbank_data_dir / "drugbank_5.1.13.csv"
+        assert path.exists()
+        assert version == "5.1.13"
+        assert m.call_count == 4
+
+
+def test_get_latest_local_index(
+    drugbank: DrugBankData,
+    drugbank_data_dir: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test use and invalidation of the local file index."""
+    (drugbank_data_dir / "drugbank_5.1.9.csv").touch()
+    (drugbank_data_dir / "drugbank_5.1.12.csv").touch()
+    path, version = drugbank.get_latest(from_local=True)
+    assert path == drugbank_data_dir / "drugbank_5.1.12.csv"
+    assert version == "5.1.12"
+
+    # valid index should be used without scanning the directory
+    scandir = os.scandir
+    scans = []
+    monkeypatch.setattr(
+        "wags_tails.drugbank.os.scandir",
+        lambda path: scans.append(path) or scandir(path),
+    )
+    path, version = drugbank.get_latest(from_local=True)
+    assert path == drugbank_data_dir / "drugbank_5.1.12.csv"
+    assert version == "5.1.12"
+    assert scans == []
+
+    # adding a file should make the index stale
+    (drugbank_data_dir / "drugbank_5.1.13.csv").touch()
+    path, version = drugbank.get_latest(from_local=True)
+    assert path == drugbank_data_dir / "drugbank_5.1.13.csv"
+    assert version == "5.1.13"
+    assert scans == [drugbank_data_dir]
+
+    path, version = drugbank.get_latest(from_local=True)
+    assert path == drugbank_data_dir / "drugbank_5.1.13.csv"
+    assert scans == [drugbank_data_dir]
+
+
+def test_get_latest_local_after_older_download(
+    drugbank: DrugBankData,
+    drugbank_data_dir: Path,
+    versions_response: dict,
+    drugbank_file: str,
+):
+    """Test that downloading a remote release older than existing local data doesn't
+    make it the latest local file.
+    """
+    (drugbank_data_dir / "drugbank_5.1.13.csv").touch()
+    with requests_mock.Mocker() as m:
+        m.get(
+            "https://go.drugbank.com/releases/latest.json",
+            json=versions_response,
+        )
+        m.get(
+            "https://go.drugbank.com/releases/5-1-12/downloads/all-drugbank-vocabulary",
+            content=drugbank_file,
+        )
+        path, version = drugbank.get_latest()
+        assert version == "5.1.12"
+
+    path, version = drugbank.get_latest(from_local=True)
+    assert path == drugbank_data_dir / "drugbank_5.1.13.csv"
+    assert version == "5.1.13"
+    path, version = drugbank.get_latest(from_local=True)
+    assert path == drugbank_data_dir / "drugbank_5.1.13.csv"
+    assert version == "5.1.13"
+
+
+def test_get_latest_local_malformed_filename(
+    drugbank: DrugBankData, drugbank_data_dir: Path
+):
+    """Test that local files with unparseable versions are skipped."""
+    for file_name in ("drugbank_5.1..csv", "drugbank_.csv", "drugbank_5.1.x.csv"):
+        (drugbank_data_dir / file_name).touch()
+    with pytest.raises(FileNotFoundError):
+        drugbank.get_latest(from_local=True)
+
+    (drugbank_data_dir / "drugbank_5.1.12.csv").touch()
+    path, version = drugbank.get_latest(from_local=True)
+    assert path == drugbank_data_dir / "drugbank_5.1.12.csv"
+    assert version == "5.1.12"
+
+
+@pytest.mark.parametrize(
+    "index_contents",
+    [
+        "[]",
+        "not json",
+        '{"drugbank": "drugbank_5.1.12.csv"}',
+        '{"drugbank": {"latest_version": "5.1.12", "file": "drugbank_5.1.12.csv"}}',
+        '{"drugbank": {"latest_version": 5, "file": null, "mtime": 0}}',
+    ],
+)
+def test_get_latest_local_malformed_index(
+    drugbank: DrugBankData, drugbank_data_dir: Path, index_contents: str
+):
+    """Test that a malformed local file index falls back to a directory scan."""
+    (drugbank_data_dir / "drugbank_5.1.12.csv").touch()
+    (drugbank_data_dir / ".wags_tails").mkdir()
+    (drugbank_data_dir / ".wags_tails" / "local_index.json").write_text(index_contents)
+    path, version = drugbank.get_latest(from_local=True)
+    assert path == drugbank_data_dir / "drugbank_5.1.12.csv"
+    assert version == "5.1.12"
+
+
+def test_get_latest_unwritable_metadata(
+    drugbank: DrugBankData,
+    drugbank_data_dir: Path,
+    versions_response: dict,
+):
+    """Test that failure to write metadata doesn't prevent lookups."""
+    (drugbank_data_dir / "drugbank_5.1.12.csv").touch()
+    # occupy the metadata location so that files can't be read from or written to it
+    (drugbank_data_dir / ".wags_tails").touch()
+    path, version = drugbank.get_latest(from_local=True)
+    assert path == drugbank_data_dir / "drugbank_5.1.12.csv"
+    assert version == "5.1.12"
+
+    with requests_mock.Mocker() as m:
+        m.get(
+            "https://go.drugbank.com/releases/latest.json",
+            json=versions_response,
+            headers={"ETag": '"abc123"'},
+        )
+        path, version = drugbank.get_latest()
+        assert path == drugbank_data_dir / "drugbank_5.1.12.csv"
+        assert version == "5.1.12"
+        assert m.call_count == 1
+
+
+def test_get_latest_version_not_modified(
+    drugbank: DrugBankData, drugbank_data_dir: Path, versions_response: dict
+):
+    """Test reuse of stored version value when the releases API reports no change."""
+    releases_url = "https://go.drugbank.com/releases/latest.json"
+    with requests_mock.Mocker() as m:
+        m.get(
+            releases_url,
+            [
+                {"json": versions_response, "headers": {"ETag": '"abc123"'}},
+                {"status_code": 304},
+            ],
+        )
+        version, url = drugbank._get_latest_version()  # noqa: SLF001
+        assert version == "5.1.12"
+        assert "If-None-Match" not in m.last_request.headers
+        assert (drugbank_data_dir / ".wags_tails" / "versions.json").exists()
+
+        clear_version_cache()
+        assert drugbank._get_latest_version() == (version, url)  # noqa: SLF001
+        assert m.last_request.headers["If-None-Match"] == '"abc123"'
+        assert m.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "cache_contents",
+    [
+        "[]",
+        '{"https://go.drugbank.com/releases/latest.json": "5.1.11"}',
+        '{"https://go.drugbank.com/releases/latest.json": {"etag": "abc123"}}',
+        '{"https://go.drugbank.com/releases/latest.json": {"value": ["5.1.11", ""]}}',
+    ],
+)
+def test_get_latest_version_malformed_cache(
+    drugbank: DrugBankData,
+    drugbank_data_dir: Path,
+    versions_response: dict,
+    cache_contents: str,
+):
+    """Test that malformed stored version metadata doesn't break version lookups."""
+    (drugbank_data_dir / ".wags_tails").mkdir()
+    (drugbank_data_dir / ".wags_tails" / "versions.json").write_text(cache_contents)
+    with requests_mock.Mocker() as m:
+        m.get("https://go.drugbank.com/releases/latest.json", json=versions_response)
+        version, _ = drugbank._get_latest_version()  # noqa: SLF001
+        assert version == "5.1.12"
+        assert "If-None-Match" not in m.last_request.headers
+
+
+def test_get_latest_version_other_release_cache(
+    drugbank: DrugBankData, drugbank_data_dir: Path, versions_response: dict
+):
+    """Test that version values stored by another wags-tails release are ignored."""
+    releases_url = "https://go.drugbank.com/releases/latest.json"
+    (drugbank_data_dir / ".wags_tails").mkdir()
+    (drugbank_data_dir / ".wags_tails" / "versions.json").write_text(
+        json.dumps(
+            {
+                releases_url: {
+                    "etag": '"abc123"',
+                    "last_modified": None,
+                    "value": {"version": "5.1.11"},
+                    "wags_tails_version": "0.0.1",
+                }
+            }
+        )
+    )
+    with requests_mock.Mocker() as m:
+        m.get(releases_url, json=versions_response)
+        version, _ = drugbank._get_latest_version()  # noqa: SLF001
+        assert version == "5.1.12"
+        assert "If-None-Match" not in m.last_request.headers
@@ -86,7 +86,7 @@ def test_get_latest(
             and paths.ligand_id_mapping.exists()
         )
         assert version == "2023.2"
-        assert m.call_count == 4
+        assert m.call_count == 3
 
         paths, version = gtop_ligand.get_latest(from_local=True)
         assert (
@@ -97,7 +97,7 @@ def test_get_latest(
             and paths.ligand_id_mapping.exists()
         )
         assert version == "2023.2"
-        assert m.call_count == 4
+        assert m.call_count == 3
 
         (gtop_data_dir / "gtop_ligands_2021.2.tsv").touch()
         paths, version = gtop_ligand.get_latest(from_local=True)
@@ -109,7 +109,7 @@ def test_get_latest(
             and paths.ligand_id_mapping.exists()
         )
         assert version == "2023.2"
-        assert m.call_count == 4
+        assert m.call_count == 3
 
         paths, version = gtop_ligand.get_latest(force_refresh=True)
         assert (
@@ -120,4 +120,42 @@ def test_get_latest(
             and paths.ligand_id_mapping.exists()
         )
         assert version == "2023.2"
-        assert m.call_count == 7
+        assert m.call_count == 6
+
+
+def test_get_latest_local_version_order(
+    gtop_ligand: GToPLigandData, gtop_data_dir: Path
+):
+    """Test that local versions are compared numerically rather than lexically."""
+    for version in ("2023.9", "2023.10"):
+        (gtop_data_dir / f"gtop_ligands_{version}.tsv").touch()
+        (gtop_data_dir / f"gtop_ligand_id_mapping_{version}.tsv").touch()
+    paths, version = gtop_ligand.get_latest(from_local=True)
+    assert paths.ligands == gtop_data_dir / "gtop_ligands_2023.10.tsv"
+    assert (
+        paths.ligand_id_mapping == gtop_data_dir / "gtop_ligand_id_mapping_2023.10.tsv"
+    )
+    assert version == "2023.10"
+
+
+def test_get_latest_local_after_older_download(
+    gtop_ligand: GToPLigandData,
+    gtop_data_dir: Path,
+    latest_release_response: str,
+):
+    """Test that downloading a remote release older than existing local data doesn't
+    make it the latest local data.
+    """
+    (gtop_data_dir / "gtop_ligands_2024.1.tsv").touch()
+    (gtop_data_dir / "gtop_ligand_id_mapping_2024.1.tsv").touch()
+    with requests_mock.Mocker() as m:
+        m.get("https://www.guidetopharmacology.org/", text=latest_release_response)
+        m.get("https://www.guidetopharmacology.org/DATA/ligands.tsv", body="")
+        m.get("https://www.guidetopharmacology.org/DATA/ligand_id_mapping.tsv", body="")
+        _, version = gtop_ligand.get_latest()
+        assert version == "2023.2"
+
+    for _ in range(2):
+        paths, version = gtop_ligand.get_latest(from_local=True)
+        assert paths.ligands == gtop_data_dir / "gtop_ligands_2024.1.tsv"
+        assert version == "2024.1"
@@ -1,13 +1,17 @@
 """Test RxNorm data source."""
 
+import io
 import json
 import os
+import tempfile
+import zipfile
 from io import TextIOWrapper
 from pathlib import Path
 
 import pytest
 import requests_mock
 
+from wags_tails.base_source import RemoteDataError
 from wags_tails.rxnorm import RxNormData
 
 
@@ -74,23 +78,69 @@ def test_get_latest(
         assert path == rxnorm_data_dir / "rxnorm_20231002.RRF"
         assert path.exists()
         assert version == "20231002"
-        assert m.call_count == 3
+        assert m.call_count == 2
 
         path, version = rxnorm.get_latest(from_local=True)
         assert path == rxnorm_data_dir / "rxnorm_20231002.RRF"
         assert path.exists()
         assert version == "20231002"
-        assert m.call_count == 3
+        assert m.call_count == 2
 
         (rxnorm_data_dir / "rxnorm_20220129.RRF").touch()
         path, version = rxnorm.get_latest(from_local=True)
         assert path == rxnorm_data_dir / "rxnorm_20231002.RRF"
         assert path.exists()
         assert version == "20231002"
-        assert m.call_count == 3
+        assert m.call_count == 2
 
         path, version = rxnorm.get_latest(force_refresh=True)
         assert path == rxnorm_data_dir / "rxnorm_20231002.RRF"
         assert path.exists()
         assert version == "20231002"
-        assert m.call_count == 5
+        assert m.call_count == 4
+
+
+def test_get_latest_no_api_key(
+    rxnorm: RxNormData, rxnorm_data_dir: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that a missing API key is caught before any requests are made."""
+    monkeypatch.delenv("UMLS_API_KEY", raising=False)
+    with requests_mock.Mocker() as m:
+        with pytest.raises(RemoteDataError, match="UMLS_API_KEY"):
+            rxnorm.get_latest()
+        with pytest.raises(RemoteDataError, match="UMLS_API_KEY"):
+            rxnorm.get_latest(force_refresh=True)
+        assert m.call_count == 0
+
+    (rxnorm_data_dir / "rxnorm_20231002.RRF").touch()
+    path, version = rxnorm.get_latest(from_local=True)
+    assert path == rxnorm_data_dir / "rxnorm_20231002.RRF"
+    assert version == "20231002"
+
+
+def test_get_latest_missing_rrf(
+    rxnorm: RxNormData,
+    latest_release_response: dict,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that a release archive without the expected RRF file is rejected, and
+    that the temporary download is removed.
+    """
+    monkeypatch.setenv("UMLS_API_KEY", "abcdefghijklmnopqrstuvwxyz")
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zip_ref:
+        zip_ref.writestr("rrf/RXNSAT.RRF", "")
+    with requests_mock.Mocker() as m:
+        m.get(
+            "https://rxnav.nlm.nih.gov/REST/version.json",
+            json=latest_release_response,
+        )
+        m.get(
+            "https://uts-ws.nlm.nih.gov/download?url=https://download.nlm.nih.gov/umls/kss/rxnorm/RxNorm_full_10022023.zip&apiKey=abcdefghijklmnopqrstuvwxyz",
+            content=archive.getvalue(),
+        )
+        with pytest.raises(RemoteDataError, match="Unable to find RxNorm RRF"):
+            rxnorm.get_latest()
+    assert list(tmp_path.iterdir()) == []